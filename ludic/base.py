@@ -1,5 +1,7 @@
+import sys
+import threading
 from abc import ABCMeta
-from collections.abc import Callable, Iterator, Mapping, MutableMapping, Sequence
+from collections.abc import Hashable, Iterator, Mapping, MutableMapping, Sequence
 from typing import (
     Any,
     ClassVar,
@@ -8,7 +10,6 @@ from typing import (
     TypeAlias,
     TypedDict,
     Unpack,
-    cast,
 )
 
 from typing_extensions import TypeVar, TypeVarTuple
@@ -19,6 +20,11 @@ from .utils import get_element_attrs_annotations
 
 ELEMENT_REGISTRY: MutableMapping[str, list[type["BaseElement"]]] = {}
 
+PURE_ELEMENTS_CACHE: MutableMapping[Hashable, tuple[Theme, str]] = {}
+PURE_ELEMENTS_CACHE_SIZE: int = 4096
+
+_PURE_ELEMENTS_CACHE_LOCK = threading.Lock()
+
 
 class Safe(str):
     """Marker for a string that is safe to use as is without HTML escaping.
@@ -71,10 +77,14 @@ class NoAttrs(TypedDict):
 
 
 class BaseElement(metaclass=ABCMeta):
+    # subclasses need to declare __slots__ too, otherwise instances get a __dict__
+    __slots__ = ("children", "attrs", "context")
+
     html_header: ClassVar[str | None] = None
     html_name: ClassVar[str | None] = None
 
     always_pair: ClassVar[bool] = False
+    pure: ClassVar[bool] = False
     formatter: ClassVar[FormatContext] = FormatContext("element_formatter")
 
     classes: ClassVar[Sequence[str]] = []
@@ -85,9 +95,29 @@ class BaseElement(metaclass=ABCMeta):
 
     context: dict[str, Any]
 
+    _open_tag: ClassVar[str] = ""
+    _close_tag: ClassVar[str] = ""
+    _start_tag: ClassVar[str] = ""
+    _empty_tag: ClassVar[str] = ""
+    _self_close: ClassVar[str] = " />"
+    _classes_str: ClassVar[str] = ""
+    _renders_self: ClassVar[bool] = True
+    _overrides_to_html: ClassVar[bool] = False
+
     def __init_subclass__(cls) -> None:
-        ELEMENT_REGISTRY.setdefault(cls.__name__, [])
-        ELEMENT_REGISTRY[cls.__name__].append(cls)
+        ELEMENT_REGISTRY.setdefault(cls.__name__, []).append(cls)
+
+        if cls.html_name:
+            cls._open_tag = f"<{cls.html_name}"
+            cls._close_tag = f"</{cls.html_name}>"
+            cls._start_tag = f"{cls._open_tag}>"
+            cls._empty_tag = f"{cls._open_tag}{cls._self_close}"
+        cls._classes_str = sys.intern(" ".join(cls.classes))
+        cls._renders_self = cls.render is BaseElement.render
+        cls._overrides_to_html = cls.to_html is not BaseElement.to_html
+        # subclasses of pure elements are not pure unless they say so
+        if "pure" not in cls.__dict__:
+            cls.pure = False
 
     def __init__(self, *children: Any, **attrs: Any) -> None:
         self.context = {}
@@ -119,6 +149,9 @@ class BaseElement(metaclass=ABCMeta):
     def _format_attributes(
         self, classes: list[str] | None = None, is_html: bool = False
     ) -> str:
+        if not self.attrs and not classes:
+            return ""
+
         attrs: dict[str, Any]
         if is_html:
             attrs = format_attrs(type(self), dict(self.attrs), is_html=True)
@@ -131,18 +164,7 @@ class BaseElement(metaclass=ABCMeta):
             else:
                 attrs["class"] = " ".join(classes)
 
-        return " ".join(f'{key}="{value}"' for key, value in attrs.items())
-
-    def _format_children(
-        self,
-        format_fun: Callable[[Any], str] = format_element,
-    ) -> str:
-        formatted = []
-        for child in self.children:
-            if isinstance(child, BaseElement):
-                child.context.update(self.context)
-            formatted.append(format_fun(child))
-        return "".join(formatted)
+        return " ".join([f'{key}="{value}"' for key, value in attrs.items()])
 
     @property
     def aliased_attrs(self) -> dict[str, Any]:
@@ -173,68 +195,180 @@ class BaseElement(metaclass=ABCMeta):
         """Check if the element has any attributes."""
         return bool(self.attrs)
 
-    def to_string(self, pretty: bool = True, _level: int = 0) -> str:
-        """Convert the element tree to a string representation.
+    def _pure_cache_key(self, theme: Theme) -> Hashable | None:
+        """Get the key under which the HTML of a pure element is cached.
+
+        The types of the values are part of the key, so that e.g. ``Safe("<b>")``
+        and ``"<b>"`` or ``True`` and ``1`` do not share the same HTML. So is
+        the version of the themes, so that changing a theme in place does not
+        serve HTML rendered with its previous settings.
 
         Args:
-            pretty (bool, optional): Whether to indent the string. Defaults to True.
+            theme (Theme): The theme the element is rendered with.
 
         Returns:
-            str: The string representation of the element tree.
+            Hashable | None: The key or :obj:`None` if the element's children
+                or attributes are not hashable (e.g. they contain elements).
         """
-        indent = "  " * _level if pretty else ""
+        key = (
+            type(self),
+            id(theme),
+            theme._version,
+            tuple((k, type(v), v) for k, v in sorted(self.attrs.items())),
+            tuple((type(child), child) for child in self.children),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _string_into(self, buf: list[str], pretty: bool, level: int) -> None:
+        indent = "  " * level if pretty else ""
         name = self.__class__.__name__
-        element = f"<{name}"
+        buf.append(f"<{name}")
 
         if self.has_attributes():
-            element += f" {self._format_attributes()}"
+            buf.append(f" {self._format_attributes()}")
 
         if self.children:
             prefix, sep, suffix = "", "", ""
             if pretty and (not self.is_simple() or self.has_attributes()):
                 prefix, sep, suffix = f"\n{indent}  ", f"\n{indent}  ", f"\n{indent}"
 
-            children_str = sep.join(
-                child.to_string(pretty=pretty, _level=_level + 1)
-                if isinstance(child, BaseElement)
-                else str(child)
-                for child in self.children
-            )
-
-            element += f">{prefix}{children_str}{suffix}</{name}>"
+            buf.append(f">{prefix}")
+            for idx, child in enumerate(self.children):
+                if idx:
+                    buf.append(sep)
+                if isinstance(child, BaseElement):
+                    child._string_into(buf, pretty, level + 1)
+                else:
+                    buf.append(str(child))
+            buf.append(f"{suffix}</{name}>")
         else:
-            element += " />"
+            buf.append(" />")
 
-        return element
+    def to_string(self, pretty: bool = True, _level: int = 0) -> str:
+        """Convert the element tree to a string representation.
 
-    def to_html(self) -> str:
-        """Convert an element tree to an HTML string."""
+        Args:
+            pretty (bool, optional): Whether to indent the string. Defaults to True.
+
+        Returns:
+            str: The string representation of the element tree.
+        """
+        buf: list[str] = []
+        self._string_into(buf, pretty, _level)
+        return "".join(buf)
+
+    def _render_into(self, buf: list[str]) -> None:
+        """Render the element tree as HTML into the given buffer.
+
+        The tree is walked iteratively using an explicit stack, all the nested
+        elements append their fragments into the same buffer, so the output
+        is joined only once in :meth:`to_html`.
+
+        Elements overriding this method (e.g. :class:`ludic.html.style`)
+        or :meth:`to_html` are delegated to when they appear in the tree.
+
+        The HTML of elements with the ``pure`` class flag set is cached
+        in :data:`PURE_ELEMENTS_CACHE` keyed by their type, theme, attributes
+        and children. Themes are compared by identity, as themes with the same
+        name can differ in settings. Only elements rendering deterministically
+        from these should be marked as pure.
+
+        Args:
+            buf (list[str]): The buffer to append the HTML fragments to.
+        """
+        stack: list[BaseElement | str | tuple[Hashable, Theme, int]] = [self]
+
+        while stack:
+            if isinstance(node := stack.pop(), str):
+                buf.append(node)
+                continue
+            elif isinstance(node, tuple):
+                key, theme, start = node
+                _cache_pure_html(key, theme, "".join(buf[start:]))
+                continue
+
+            if node is not self and node._overrides_to_html:
+                buf.append(node.to_html())
+                continue
+
+            if node.pure and (key := node._pure_cache_key(theme := node.theme)):
+                cached = PURE_ELEMENTS_CACHE.get(key)
+                if cached is not None and cached[0] is theme:
+                    buf.append(cached[1])
+                    continue
+                # marks the end of the element's HTML which is cached when popped
+                stack.append((key, theme, len(buf)))
+
+            dom, classes = node._resolve_render()
+            if dom is not self and type(dom)._render_into is not _base_render_into:
+                dom._render_into(buf)
+            else:
+                dom._render_tag_into(buf, stack, classes)
+
+    def _resolve_render(self) -> tuple["BaseElement", list[str]]:
+        """Follow the render chain of the element down to the rendered element.
+
+        Returns:
+            tuple[BaseElement, list[str]]: The rendered element and the classes
+                of all the elements in the chain.
+        """
         dom = self
-        classes = list(dom.classes)
+        classes = [dom._classes_str] if dom._classes_str else []
 
-        while dom != (rendered_dom := dom.render()):
+        while not dom._renders_self and dom != (rendered_dom := dom.render()):
             rendered_dom.context.update(dom.context)
             dom = rendered_dom
-            classes += dom.classes
+            if dom._classes_str:
+                classes.append(dom._classes_str)
 
-        element_tag = f"{dom.html_header}\n" if dom.html_header else ""
+        return dom, classes
 
-        hidden = dom.html_name == "__hidden__"
-        element_tag += "" if hidden else f"<{dom.html_name}"
+    def _render_tag_into(
+        self,
+        buf: list[str],
+        stack: list[Any],
+        classes: list[str],
+    ) -> None:
+        """Render the element's tag into the buffer and schedule its children.
 
-        if not hidden and (dom.has_attributes() or classes):
-            attributes_str = dom._format_attributes(classes, is_html=True)
-            element_tag += f" {attributes_str}"
+        Args:
+            buf (list[str]): The buffer to append the HTML fragments to.
+            stack (list[Any]): The stack of the nodes to render.
+            classes (list[str]): The classes to add to the element's attributes.
+        """
+        if self.html_header:
+            buf.append(f"{self.html_header}\n")
 
-        if dom.children or dom.always_pair:
-            children_str = dom._format_children()
-            element_tag += (
-                children_str if hidden else f">{children_str}</{dom.html_name}>"
-            )
-        elif not hidden:
-            element_tag += " />"
+        hidden = self.html_name == "__hidden__"
+        paired = bool(self.children) or self.always_pair
 
-        return element_tag
+        if not hidden:
+            if self.has_attributes() or classes:
+                attributes = self._format_attributes(classes, is_html=True)
+                end = ">" if paired else self._self_close
+                buf.append(f"{self._open_tag} {attributes}{end}")
+            else:
+                buf.append(self._start_tag if paired else self._empty_tag)
+
+        if paired:
+            if not hidden:
+                stack.append(self._close_tag)
+            for child in reversed(self.children):
+                if isinstance(child, BaseElement):
+                    child.context.update(self.context)
+                    stack.append(child)
+                else:
+                    stack.append(format_element(child))
+
+    def to_html(self) -> str:
+        """Convert an element tree to an HTML string."""
+        buf: list[str] = []
+        self._render_into(buf)
+        return "".join(buf)
 
     def attrs_for(self, cls: type["BaseElement"]) -> dict[str, Any]:
         """Get the attributes of this component that are defined in the given element.
@@ -246,16 +380,25 @@ class BaseElement(metaclass=ABCMeta):
             cls (type[BaseElement]): The element to get the attributes of.
 
         """
-        return {
-            key: value
-            for key, value in self.attrs.items()
-            if key in get_element_attrs_annotations(cls)
-        }
+        annotations = get_element_attrs_annotations(cls)
+        return {key: value for key, value in self.attrs.items() if key in annotations}
 
     def render(self) -> "BaseElement":
         return self
 
 
+_base_render_into = BaseElement._render_into
+
+
+def _cache_pure_html(key: Hashable, theme: Theme, html: str) -> None:
+    # the theme is kept alive with the HTML so that its id is not reused,
+    # the lock guards the eviction as elements can be rendered in threads
+    with _PURE_ELEMENTS_CACHE_LOCK:
+        if PURE_ELEMENTS_CACHE and len(PURE_ELEMENTS_CACHE) >= PURE_ELEMENTS_CACHE_SIZE:
+            del PURE_ELEMENTS_CACHE[next(iter(PURE_ELEMENTS_CACHE))]
+        PURE_ELEMENTS_CACHE[key] = (theme, html)
+
+
 NoChildren: TypeAlias = Never
 """Type alias for elements that are not allowed to have children."""
 
@@ -295,6 +438,8 @@ class Element(Generic[TChildren, TAttrs], BaseElement):
         **attrs (Unpack[TAttrs]): The attributes of the element.
     """
 
+    __slots__ = ()
+
     children: tuple[TChildren, ...]
     attrs: TAttrs
 
@@ -304,8 +449,9 @@ class Element(Generic[TChildren, TAttrs], BaseElement):
         # FIXME: https://github.com/python/typing/issues/1399
         **attributes: Unpack[TAttrs],  # type: ignore
     ) -> None:
-        super().__init__()
-        self.attrs = cast(TAttrs, attributes)
+        # sets all the slots directly instead of calling BaseElement.__init__
+        self.context = {}
+        self.attrs = attributes  # type: ignore[assignment]
         self.children = tuple(self.formatter.extract(*children))
 
 
@@ -317,6 +463,8 @@ class ElementStrict(Generic[*TChildrenArgs, TAttrs], BaseElement):
         **attrs (Unpack[TAttrs]): The attributes of the element.
     """
 
+    __slots__ = ()
+
     children: tuple[*TChildrenArgs]
     attrs: TAttrs
 
@@ -326,6 +474,7 @@ class ElementStrict(Generic[*TChildrenArgs, TAttrs], BaseElement):
         # FIXME: https://github.com/python/typing/issues/1399
         **attrs: Unpack[TAttrs],  # type: ignore
     ) -> None:
-        super().__init__()
-        self.attrs = cast(TAttrs, attrs)
+        # sets all the slots directly instead of calling BaseElement.__init__
+        self.context = {}
+        self.attrs = attrs
         self.children = tuple(self.formatter.extract(*children))
@@ -11,6 +11,8 @@ class Button(ComponentStrict[PrimitiveChildren, ButtonAttrs]):
     The component creates a button.
     """
 
+    __slots__ = ()
+
     classes = ["btn"]
     styles = style.use(
         lambda theme: {
@@ -54,6 +56,8 @@ class ButtonPrimary(Button):
     The component creates a button with the ``primary`` class.
     """
 
+    __slots__ = ()
+
     classes = ["btn", "primary"]
     styles = style.use(
         lambda theme: {
@@ -71,6 +75,8 @@ class ButtonSecondary(Button):
     The component creates a button with the ``secondary`` class.
     """
 
+    __slots__ = ()
+
     classes = ["btn", "secondary"]
     styles = style.use(
         lambda theme: {
@@ -88,6 +94,8 @@ class ButtonLink(Button):
     The component creates a button with the ``secondary`` class.
     """
 
+    __slots__ = ()
+
     classes = ["btn", "link"]
     styles = style.use(
         lambda theme: {
@@ -124,6 +132,8 @@ class ButtonSuccess(Button):
     The component creates a button with the ``success`` class.
     """
 
+    __slots__ = ()
+
     classes = ["btn", "success"]
     styles = style.use(
         lambda theme: {
@@ -141,6 +151,8 @@ class ButtonDanger(Button):
     The component creates a button with the ``danger`` class.
     """
 
+    __slots__ = ()
+
     classes = ["btn", "danger"]
     styles = style.use(
         lambda theme: {
@@ -158,6 +170,8 @@ class ButtonWarning(Button):
     The component creates a button with the ``warning`` class.
     """
 
+    __slots__ = ()
+
     classes = ["btn", "warning"]
     styles = style.use(
         lambda theme: {
@@ -175,6 +189,8 @@ class ButtonInfo(Button):
     The component creates a button with the ``info`` class.
     """
 
+    __slots__ = ()
+
     classes = ["btn", "info"]
     styles = style.use(
         lambda theme: {
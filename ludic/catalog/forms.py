@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import Any, Literal, get_type_hints, override
 
 from ludic.attrs import Attrs, FormAttrs, InputAttrs, TextAreaAttrs
+from ludic.components import render_as
 from ludic.html import div, form, input, label, style, textarea
 from ludic.types import (
     BaseElement,
@@ -23,6 +24,8 @@ DEFAULT_FIELD_PARSERS: Mapping[str, Callable[[Any], PrimitiveChildren]] = {
     "checkbox": lambda value: True if value == "on" else False,
 }
 
+_FIELDS_METADATA_CACHE: dict[type[Any], tuple[tuple[str, "FieldMeta"], ...]] = {}
+
 
 @dataclass
 class FieldMeta:
@@ -58,13 +61,7 @@ class FieldMeta:
         elif self.label == "auto":
             attrs["label"] = attr_to_camel(key)
 
-        match self.kind:
-            case "input":
-                return InputField(value=value, type=self.type, **attrs)
-            case "checkbox":
-                return InputField(checked=value, type="checkbox", **attrs)
-            case "textarea":
-                return TextAreaField(value=value, **attrs)
+        return _FIELD_FACTORIES[self.kind](self, value, attrs)
 
     def parse(self, value: Any) -> PrimitiveChildren:
         if self.parser:
@@ -99,6 +96,8 @@ class TextAreaFieldAttrs(FieldAttrs, TextAreaAttrs):
 class FormField(Component[TChildren, TAttrs]):
     """Base class for form fields."""
 
+    __slots__ = ()
+
     classes = ["form-field"]
     styles = style.use(
         lambda theme: {
@@ -130,6 +129,8 @@ class FormField(Component[TChildren, TAttrs]):
 class InputField(FormField[NoChildren, InputFieldAttrs]):
     """Represents the HTML ``input`` element with an optional ``label`` element."""
 
+    __slots__ = ()
+
     @override
     def render(self) -> div:
         attrs = self.attrs_for(input)
@@ -147,6 +148,8 @@ class InputField(FormField[NoChildren, InputFieldAttrs]):
 class TextAreaField(FormField[PrimitiveChildren, TextAreaFieldAttrs]):
     """Represents the HTML ``textarea`` element with an optional ``label`` element."""
 
+    __slots__ = ()
+
     @override
     def render(self) -> div:
         attrs = self.attrs_for(textarea)
@@ -164,11 +167,32 @@ class TextAreaField(FormField[PrimitiveChildren, TextAreaFieldAttrs]):
 class Form(Component[ComplexChildren, FormAttrs]):
     """A component helper for creating HTML forms."""
 
+    __slots__ = ()
+
     classes = ["form", "stack"]
 
-    @override
-    def render(self) -> form:
-        return form(*self.children, **self.attrs)
+    render = render_as(form)
+
+
+def _create_input(meta: FieldMeta, value: Any, attrs: dict[str, Any]) -> BaseElement:
+    return InputField(value=value, type=meta.type, **attrs)
+
+
+def _create_checkbox(meta: FieldMeta, value: Any, attrs: dict[str, Any]) -> BaseElement:
+    return InputField(checked=value, type="checkbox", **attrs)
+
+
+def _create_textarea(meta: FieldMeta, value: Any, attrs: dict[str, Any]) -> BaseElement:
+    return TextAreaField(value, **attrs)
+
+
+_FIELD_FACTORIES: Mapping[
+    str, Callable[[FieldMeta, Any, dict[str, Any]], BaseElement]
+] = {
+    "input": _create_input,
+    "checkbox": _create_checkbox,
+    "textarea": _create_textarea,
+}
 
 
 def create_fields(attrs: Any, spec: type[TAttrs]) -> tuple[ComplexChildren, ...]:
@@ -195,13 +219,19 @@ def create_fields(attrs: Any, spec: type[TAttrs]) -> tuple[ComplexChildren, ...]
     Returns:
         ComplexChild: list of form fields.
     """
-    annotations = get_type_hints(spec, include_extras=True)
-    metadata_list = get_annotations_metadata_of_type(annotations, FieldMeta)
     fields: list[ComplexChildren] = []
 
-    for name, metadata in metadata_list.items():
+    for name, metadata in _get_fields_metadata(spec):
         if value := (attrs.get(name) or getattr(attrs, name, None)):
             field = metadata.format(name, value)
             fields.append(field)
 
     return tuple(fields)
+
+
+def _get_fields_metadata(spec: type[Any]) -> tuple[tuple[str, FieldMeta], ...]:
+    if (fields_metadata := _FIELDS_METADATA_CACHE.get(spec)) is None:
+        annotations = get_type_hints(spec, include_extras=True)
+        metadata_list = get_annotations_metadata_of_type(annotations, FieldMeta)
+        fields_metadata = _FIELDS_METADATA_CACHE[spec] = tuple(metadata_list.items())
+    return fields_metadata
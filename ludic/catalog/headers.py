@@ -14,6 +14,9 @@ class AnchorAttrs(Attrs):
 class Anchor(Component[str, AnchorAttrs]):
     """Component representing a clickable anchor."""
 
+    __slots__ = ()
+
+    pure = True
     classes = ["anchor"]
     styles = style.use(
         lambda theme: {
@@ -44,6 +47,8 @@ class WithAnchorAttrs(GlobalAttrs, total=False):
 class WithAnchor(ComponentStrict[h1 | h2 | h3 | h4 | str, WithAnchorAttrs]):
     """Component which renders its content (header) with a clickable anchor."""
 
+    __slots__ = ()
+
     classes = ["with-anchor"]
     styles = style.use(
         lambda theme: {
@@ -66,22 +71,26 @@ class WithAnchor(ComponentStrict[h1 | h2 | h3 | h4 | str, WithAnchorAttrs]):
         else:
             element = self.children[0]
 
-        element.attrs.setdefault("id", text_to_kebab(element.text))
-        id = element.attrs["id"]
+        if (id := element.attrs.get("id")) is None:
+            id = element.attrs["id"] = text_to_kebab(element.text)
 
-        return div(
-            element,
-            (self.attrs["anchor"] if "anchor" in self.attrs else Anchor(target=id)),
-        )
+        if (anchor := self.attrs.get("anchor")) is None:
+            anchor = Anchor(target=id)
+
+        return div(element, anchor)
 
 
 class H1(ComponentStrict[str, WithAnchorAttrs]):
     """Component rendering as h1 with an optional clickable anchor."""
 
+    __slots__ = ()
+
+    pure = True
+
     @override
     def render(self) -> h1 | WithAnchor:
         header = h1(self.children[0], **self.attrs_for(h1))
-        if anchor := self.attrs.get("anchor"):
+        if (anchor := self.attrs.get("anchor")) is not None:
             return WithAnchor(header, anchor=anchor)
         elif self.theme.headers.h1.anchor:
             return WithAnchor(header)
@@ -92,10 +101,14 @@ class H1(ComponentStrict[str, WithAnchorAttrs]):
 class H2(ComponentStrict[str, WithAnchorAttrs]):
     """Component rendering as h2 with an optional clickable anchor."""
 
+    __slots__ = ()
+
+    pure = True
+
     @override
     def render(self) -> h2 | WithAnchor:
         header = h2(self.children[0], **self.attrs_for(h2))
-        if anchor := self.attrs.get("anchor"):
+        if (anchor := self.attrs.get("anchor")) is not None:
             return WithAnchor(header, anchor=anchor)
         elif self.theme.headers.h2.anchor:
             return WithAnchor(header)
@@ -106,10 +119,14 @@ class H2(ComponentStrict[str, WithAnchorAttrs]):
 class H3(ComponentStrict[str, WithAnchorAttrs]):
     """Component rendering as h3 with an optional clickable anchor."""
 
+    __slots__ = ()
+
+    pure = True
+
     @override
     def render(self) -> h3 | WithAnchor:
         header = h3(self.children[0], **self.attrs_for(h3))
-        if anchor := self.attrs.get("anchor"):
+        if (anchor := self.attrs.get("anchor")) is not None:
             return WithAnchor(header, anchor=anchor)
         elif self.theme.headers.h3.anchor:
             return WithAnchor(header)
@@ -120,10 +137,14 @@ class H3(ComponentStrict[str, WithAnchorAttrs]):
 class H4(ComponentStrict[str, WithAnchorAttrs]):
     """Component rendering as h4 with an optional clickable anchor."""
 
+    __slots__ = ()
+
+    pure = True
+
     @override
     def render(self) -> h4 | WithAnchor:
         header = h4(self.children[0], **self.attrs_for(h4))
-        if anchor := self.attrs.get("anchor"):
+        if (anchor := self.attrs.get("anchor")) is not None:
             return WithAnchor(header, anchor=anchor)
         elif self.theme.headers.h4.anchor:
             return WithAnchor(header)
@@ -2,6 +2,7 @@ from collections.abc import Iterable
 from typing import override
 
 from ludic.attrs import GlobalAttrs
+from ludic.components import render_as
 from ludic.html import dd, dl, dt, style
 from ludic.types import Component, PrimitiveChildren
 
@@ -11,17 +12,17 @@ from .utils import attr_to_camel
 class Key(Component[PrimitiveChildren, GlobalAttrs]):
     """Simple component rendering as the HTML ``dt`` element."""
 
-    @override
-    def render(self) -> dt:
-        return dt(*self.children, **self.attrs)
+    __slots__ = ()
+
+    render = render_as(dt)
 
 
 class Value(Component[PrimitiveChildren, GlobalAttrs]):
     """Simple component rendering as the HTML ``dd`` element."""
 
-    @override
-    def render(self) -> dd:
-        return dd(*self.children, **self.attrs)
+    __slots__ = ()
+
+    render = render_as(dd)
 
 
 class PairsAttrs(GlobalAttrs, total=False):
@@ -55,6 +56,8 @@ class Pairs(Component[Key | Value, PairsAttrs]):
         )
     """
 
+    __slots__ = ()
+
     classes = ["stack", "small"]
     styles = style.use(
         lambda theme: {
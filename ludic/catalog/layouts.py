@@ -19,6 +19,8 @@ class Stack(div):
     All children components will have a space (margin) separating them.
     """
 
+    __slots__ = ()
+
     classes = ["stack"]
     styles = style.use(
         lambda theme: {
@@ -69,6 +71,8 @@ class Box(div):
         )
     """
 
+    __slots__ = ()
+
     classes = ["box"]
     styles = style.use(
         lambda theme: {
@@ -107,6 +111,8 @@ class Center(div):
         )
     """
 
+    __slots__ = ()
+
     classes = ["center"]
     styles = style.use(
         lambda theme: {
@@ -134,6 +140,8 @@ class Cluster(div):
         )
     """
 
+    __slots__ = ()
+
     classes = ["cluster"]
     styles = style.use(
         lambda theme: {
@@ -163,6 +171,8 @@ class Cluster(div):
 class Sidebar(div):
     """The sidebar part of a WithSidebar component."""
 
+    __slots__ = ()
+
     classes = ["sidebar"]
 
 
@@ -184,6 +194,8 @@ class WithSidebar(ComponentStrict[AnyChildren, AnyChildren, GlobalAttrs]):
         )
     """
 
+    __slots__ = ()
+
     classes = ["with-sidebar"]
     styles = style.use(
         lambda theme: {
@@ -230,6 +242,8 @@ class Switcher(div):
         )
     """
 
+    __slots__ = ()
+
     classes = ["switcher"]
     styles = style.use(
         lambda theme: {
@@ -1,6 +1,7 @@
 from typing import override
 
 from ludic.attrs import GlobalAttrs
+from ludic.components import render_as
 from ludic.html import li, ol, ul
 from ludic.types import AnyChildren, Component
 
@@ -17,9 +18,9 @@ class Item(Component[AnyChildren, GlobalAttrs]):
         Item("Item 1")
     """
 
-    @override
-    def render(self) -> li:
-        return li(*self.children, **self.attrs)
+    __slots__ = ()
+
+    render = render_as(li)
 
 
 class List(Component[Item, ListAttrs]):
@@ -33,6 +34,8 @@ class List(Component[Item, ListAttrs]):
         List(Item("Item 1"), Item("Item 2"))
     """
 
+    __slots__ = ()
+
     @override
     def render(self) -> ul:
         if items := self.attrs.get("items"):
@@ -53,6 +56,8 @@ class NumberedList(Component[Item, ListAttrs]):
         NumberedList(Item("Item 1"), Item("Item 2"))
     """
 
+    __slots__ = ()
+
     @override
     def render(self) -> ol:
         if items := self.attrs.get("items"):
@@ -6,6 +6,8 @@ from ludic.types import AnyChildren, Component
 
 
 class Loading(Component[AnyChildren, NoAttrs]):
+    __slots__ = ()
+
     classes = ["loader"]
     styles = style.use(
         lambda theme: {
@@ -92,6 +94,8 @@ class LazyLoader(Component[AnyChildren, LazyLoaderAttrs]):
         )
     """
 
+    __slots__ = ()
+
     @override
     def render(self) -> div:
         self.attrs.setdefault("hx_trigger", "load")
@@ -19,6 +19,8 @@ class NavHeader(ComponentStrict[str, GlobalAttrs]):
     component.
     """
 
+    __slots__ = ()
+
     classes = ["nav-header"]
     styles = style.use(
         lambda theme: {
@@ -40,6 +42,8 @@ class NavItem(Component[PrimitiveChildren, NavItemAttrs]):
     component.
     """
 
+    __slots__ = ()
+
     classes = ["nav-item"]
 
     @override
@@ -60,6 +64,8 @@ class NavSection(ComponentStrict[NavHeader, *tuple[NavItem, ...], GlobalAttrs]):
     component.
     """
 
+    __slots__ = ()
+
     @override
     def render(self) -> li:
         self.attrs.setdefault("classes", ["stack", "tiny"])
@@ -81,6 +87,8 @@ class Navigation(Component[NavItem | NavSection, GlobalAttrs]):
         )
     """
 
+    __slots__ = ()
+
     classes = ["navigation"]
     styles = {
         "nav.navigation ul": {
@@ -16,6 +16,8 @@ class HtmlBodyAttrs(Attrs, total=False):
 
 
 class Head(Component[AnyChildren, HtmlHeadAttrs]):
+    __slots__ = ()
+
     @override
     def render(self) -> head:
         return head(
@@ -26,6 +28,8 @@ class Head(Component[AnyChildren, HtmlHeadAttrs]):
 
 
 class Body(Component[AnyChildren, HtmlBodyAttrs]):
+    __slots__ = ()
+
     @override
     def render(self) -> body:
         scripts = []
@@ -38,6 +42,8 @@ class Body(Component[AnyChildren, HtmlBodyAttrs]):
 
 
 class HtmlPage(ComponentStrict[Head, Body, NoAttrs]):
+    __slots__ = ()
+
     styles = style.use(
         lambda theme: {
             # global styling
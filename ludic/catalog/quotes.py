@@ -13,6 +13,8 @@ class QuoteAttrs(Attrs, total=False):
 class Quote(ComponentStrict[str, QuoteAttrs]):
     """Simple component rendering as the HTML ``blockquote`` element."""
 
+    __slots__ = ()
+
     classes = ["quote"]
     styles = style.use(
         lambda theme: {
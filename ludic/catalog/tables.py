@@ -62,6 +62,8 @@ class ColumnMeta:
 class TableRow(Component[AnyChildren, GlobalAttrs]):
     """Simple component rendering as the HTML ``tr`` element."""
 
+    __slots__ = ()
+
     def get_value(self, index: int) -> PrimitiveChildren | None:
         if len(self.children) > index:
             child = self.children[index]
@@ -79,6 +81,8 @@ class TableRow(Component[AnyChildren, GlobalAttrs]):
 class TableHead(Component[AnyChildren, GlobalAttrs]):
     """Simple component rendering as the HTML ``tr`` element."""
 
+    __slots__ = ()
+
     @property
     def header(self) -> tuple[PrimitiveChildren, ...]:
         return tuple(
@@ -125,6 +129,8 @@ class Table(ComponentStrict[THead, *tuple[TRow, ...], TableAttrs]):
         )
     """
 
+    __slots__ = ()
+
     classes = ["table"]
     styles = style.use(
         lambda theme: {
@@ -10,6 +10,7 @@ except ImportError:
     pygments_loaded = False
 
 from ludic.attrs import GlobalAttrs
+from ludic.components import render_as
 from ludic.html import a, code, p, pre, style
 from ludic.types import (
     AnyChildren,
@@ -44,6 +45,8 @@ class Link(ComponentStrict[PrimitiveChildren, LinkAttrs]):
         Link("Hello, World!", to="https://example.com")
     """
 
+    __slots__ = ()
+
     @override
     def render(self) -> a:
         attrs = {"href": self.attrs["to"]}
@@ -70,9 +73,9 @@ class Paragraph(Component[AnyChildren, GlobalAttrs]):
         Paragraph(f"Hello, {b("World")}!")
     """
 
-    @override
-    def render(self) -> p:
-        return p(*self.children, **self.attrs)
+    __slots__ = ()
+
+    render = render_as(p)
 
 
 class Code(Component[str, GlobalAttrs]):
@@ -83,6 +86,8 @@ class Code(Component[str, GlobalAttrs]):
         Code("print('Hello, World!')")
     """
 
+    __slots__ = ()
+
     classes = ["code"]
     styles = style.use(
         lambda theme: {
@@ -95,9 +100,7 @@ class Code(Component[str, GlobalAttrs]):
         }
     )
 
-    @override
-    def render(self) -> code:
-        return code(*self.children, **self.attrs)
+    render = render_as(code)
 
 
 class CodeBlockAttrs(GlobalAttrs, total=False):
@@ -113,6 +116,8 @@ class CodeBlock(Component[str, CodeBlockAttrs]):
         CodeBlock("print('Hello, World!')")
     """
 
+    __slots__ = ()
+
     classes = ["code-block"]
     styles = style.use(
         lambda theme: {
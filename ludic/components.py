@@ -1,8 +1,12 @@
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable
+from typing import TypeVar
 
 from .base import BaseElement, Element, ElementStrict
 from .types import NoAttrs, TAttrs, TChildren, TChildrenArgs
 
+_TElement = TypeVar("_TElement", bound=BaseElement)
+
 
 class Component(Element[TChildren, TAttrs], metaclass=ABCMeta):
     """Base class for components.
@@ -31,6 +35,8 @@ class Component(Element[TChildren, TAttrs], metaclass=ABCMeta):
 
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def render(self) -> BaseElement:
         """Render the component as an instance of :class:`BaseElement`."""
@@ -69,6 +75,8 @@ class ComponentStrict(ElementStrict[*TChildrenArgs, TAttrs], metaclass=ABCMeta):
     We also specify age as an optional key-word argument.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def render(self) -> BaseElement:
         """Render the component as an instance of :class:`BaseElement`."""
@@ -81,7 +89,50 @@ class Blank(Element[TChildren, NoAttrs]):
     when rendering a component.
     """
 
+    __slots__ = ()
+
     html_name = "__hidden__"
 
     def __init__(self, *children: TChildren) -> None:
         super().__init__(*self.formatter.extract(*children))
+
+
+def render_as(element: type[_TElement]) -> Callable[[BaseElement], _TElement]:  # noqa: UP047
+    """Create a render method wrapping the component's children and attributes.
+
+    The created method is equivalent to the following one, however, the children
+    are not processed again when the element is created, since they were
+    already processed when the component was created:
+
+        @override
+        def render(self) -> div:
+            return div(*self.children, **self.attrs)
+
+    Elements with a custom constructor are always created the regular way.
+
+    Example usage:
+
+        class Paragraph(Component[AnyChildren, GlobalAttrs]):
+            render = render_as(p)
+
+    Args:
+        element (type[BaseElement]): The element to render the component as.
+
+    Returns:
+        Callable[[BaseElement], BaseElement]: The render method.
+    """
+    if element.__init__ not in (Element.__init__, ElementStrict.__init__):
+
+        def render(self: BaseElement) -> _TElement:
+            return element(*self.children, **self.attrs)
+
+        return render
+
+    def render_fast(self: BaseElement) -> _TElement:
+        rendered = element.__new__(element)
+        rendered.context = {}
+        rendered.children = tuple(self.children)
+        rendered.attrs = dict(self.attrs)
+        return rendered
+
+    return render_fast
@@ -1,16 +1,39 @@
-import html
 import random
 import re
+from collections.abc import Mapping
 from contextvars import ContextVar
+from functools import cache
+from types import MappingProxyType
 from typing import Annotated, Any, Final, TypeVar, get_args, get_origin
 
 from .utils import get_element_attrs_annotations
 
-EXTRACT_NUMBER_RE: Final[re.Pattern[str]] = re.compile(r"\{(\d+:id)\}")
+EXTRACT_NUMBER_RE: Final[re.Pattern[str]] = re.compile(r"\{(\d+):id\}")
+TEXT_ESCAPE_TABLE: Final[dict[int, str]] = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;"}
+)
+
+_MISSING: Final[Any] = object()
 
 T = TypeVar("T")
 
 
+def escape_text(text: str) -> str:
+    """Escape the given text so it can be used in an HTML element or attribute.
+
+    This is equivalent to ``html.escape(text, quote=False)``, however, the
+    translation runs in a single pass and returns the text unchanged
+    when there is nothing to escape.
+
+    Args:
+        text (str): The text to escape.
+
+    Returns:
+        str: The escaped text.
+    """
+    return text.translate(TEXT_ESCAPE_TABLE)
+
+
 def format_attr_value(key: str, value: Any, is_html: bool = False) -> str:
     """Format an HTML attribute with the given key and value.
 
@@ -22,18 +45,18 @@ def format_attr_value(key: str, value: Any, is_html: bool = False) -> str:
     """
     if isinstance(value, dict):
         value = ";".join(
-            f"{dict_key}:{html.escape(dict_value, False)}"
+            f"{dict_key}:{escape_text(dict_value)}"
             for dict_key, dict_value in value.items()
         )
     elif isinstance(value, list):
-        value = " ".join(html.escape(v, False) for v in value)
+        value = " ".join(escape_text(v) for v in value)
     elif isinstance(value, bool):
         if is_html and not key.startswith("hx"):
-            value = html.escape(key, False) if value else ""
+            value = escape_text(key) if value else ""
         else:
             value = "true" if value else "false"
     elif isinstance(value, str) and getattr(value, "escape", True):
-        value = html.escape(value, False)
+        value = escape_text(value)
     return str(value)
 
 
@@ -65,19 +88,12 @@ def format_attrs(
     Returns:
         dict[str, Any]: The formatted attributes.
     """
-    hints = get_element_attrs_annotations(attrs_type, include_extras=True)
-
-    def _get_key(key: str) -> str:
-        if get_origin(hints[key]) is Annotated:
-            args = get_args(hints[key])
-            if len(args) > 1 and isinstance(args[1], str):
-                return args[1]
-        return key
+    aliases = get_attrs_aliases(attrs_type)
 
     result: dict[str, str] = {}
     for key, value in attrs.items():
         if formatted_value := format_attr_value(key, value, is_html=is_html):
-            alias = _get_key(key)
+            alias = aliases[key]
             if alias in result:
                 result[alias] += " " + formatted_value
             else:
@@ -85,26 +101,58 @@ def format_attrs(
     return result
 
 
+def get_attrs_aliases(attrs_type: Any) -> Mapping[str, str]:
+    """Get the mapping of attribute names to their aliases used in HTML.
+
+    An alias is defined using :class:`typing.Annotated` with a string metadata,
+    e.g. ``class_: Annotated[str, "class"]``. Attributes without an alias
+    map to themselves.
+
+    Args:
+        attrs_type (Any): The element.
+
+    Returns:
+        Mapping[str, str]: The attribute names mapped to their aliases.
+    """
+    if isinstance(attrs_type, type):
+        return _get_class_attrs_aliases(attrs_type)
+    return _get_attrs_aliases(attrs_type)
+
+
+def _get_attrs_aliases(attrs_type: Any) -> dict[str, str]:
+    hints = get_element_attrs_annotations(attrs_type, include_extras=True)
+    aliases: dict[str, str] = {}
+    for key, hint in hints.items():
+        aliases[key] = key
+        if get_origin(hint) is Annotated:
+            args = get_args(hint)
+            if len(args) > 1 and isinstance(args[1], str):
+                aliases[key] = args[1]
+    return aliases
+
+
+@cache
+def _get_class_attrs_aliases(attrs_type: type) -> Mapping[str, str]:
+    # the shared result is read-only so that callers cannot change it
+    return MappingProxyType(_get_attrs_aliases(attrs_type))
+
+
 def format_element(child: Any) -> str:
     """Default HTML formatter.
 
     Args:
         child (AnyChild): The HTML element or text to format.
     """
-    if isinstance(child, str) and getattr(child, "escape", True):
-        return html.escape(child, False)
+    if type(child) is str:
+        return escape_text(child)
+    elif isinstance(child, str):
+        return escape_text(child) if getattr(child, "escape", True) else child
     elif hasattr(child, "to_html"):
         return child.to_html()  # type: ignore
     else:
         return str(child)
 
 
-def _extract_match(text: str | Any) -> int | str:
-    if text.endswith(":id") and text[:-3].isdigit():
-        return int(text[:-3])
-    return str(text)
-
-
 def extract_identifiers(text: str) -> list[str | int]:
     """Extract numbers from a string.
 
@@ -114,12 +162,16 @@ def extract_identifiers(text: str) -> list[str | int]:
     Returns:
         Iterable[int]: The extracted numbers.
     """
-    parts = [_extract_match(match) for match in EXTRACT_NUMBER_RE.split(text) if match]
-    if any(isinstance(part, int) for part in parts):
-        return parts
-    else:
+    if ":id}" not in text:
+        # fast path for strings not created with f-strings containing elements
         return []
 
+    # the identifiers are captured by the pattern, so they are on the odd indexes
+    parts = EXTRACT_NUMBER_RE.split(text)
+    if len(parts) == 1:
+        return []
+    return [int(part) if idx % 2 else part for idx, part in enumerate(parts) if part]
+
 
 class FormatContext:
     """Format context helper for using f-strings in elements.
@@ -194,17 +246,24 @@ class FormatContext:
             Any: The extracted arguments.
         """
         extracted_args: list[Any] = []
+        append = extracted_args.append
+        cache: dict[int, Any] | None = None
+
         for arg in args:
-            if isinstance(arg, str) and (parts := extract_identifiers(arg)):
+            if not isinstance(arg, str) or not (parts := extract_identifiers(arg)):
+                append(arg)
+                continue
+
+            if cache is None:
                 cache = self.get()
-                extracted_args.extend(
-                    cache.pop(part) if isinstance(part, int) else part
-                    for part in parts
-                    if not isinstance(part, int) or part in cache
-                )
-                self._context.set(cache)
-            else:
-                extracted_args.append(arg)
+            for part in parts:
+                if isinstance(part, str):
+                    append(part)
+                elif (obj := cache.pop(part, _MISSING)) is not _MISSING:
+                    append(obj)
+
+        if cache is not None:
+            self._context.set(cache)
         return extracted_args
 
     def clear(self) -> None:
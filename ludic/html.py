@@ -75,259 +75,326 @@ from .types import (
 
 
 class div(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "div"
 
 
 class span(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "span"
 
 
 class main(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "main"
 
 
 class p(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "p"
 
 
 class a(Element[AnyChildren, HyperlinkAttrs]):
+    __slots__ = ()
     html_name = "a"
 
 
 class br(Element[NoChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "br"
 
 
 class button(Element[AnyChildren, ButtonAttrs]):
+    __slots__ = ()
     html_name = "button"
 
 
 class label(Element[AnyChildren, LabelAttrs]):
+    __slots__ = ()
     html_name = "label"
 
 
 class td(Element[AnyChildren, TdAttrs]):
+    __slots__ = ()
     html_name = "td"
 
 
 class th(Element[AnyChildren, ThAttrs]):
+    __slots__ = ()
     html_name = "th"
 
 
 class tr(Element[ComplexChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "tr"
 
 
 class thead(Element[ComplexChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "thead"
 
 
 class tbody(Element[ComplexChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "tbody"
 
 
 class tfoot(Element[ComplexChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "tfoot"
 
 
 class table(Element[ComplexChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "table"
 
 
 class li(Element[AnyChildren, LiAttrs]):
+    __slots__ = ()
     html_name = "li"
 
 
 class ul(Element[ComplexChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "ul"
 
 
 class ol(Element[ComplexChildren, OlAttrs]):
+    __slots__ = ()
     html_name = "ol"
 
 
 class dt(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "dt"
 
 
 class dd(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "dd"
 
 
 class dl(Element[ComplexChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "dl"
 
 
 class section(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "section"
 
 
 class input(Element[NoChildren, InputAttrs]):
+    __slots__ = ()
     html_name = "input"
 
 
 class output(Element[NoChildren, OutputAttrs]):
+    __slots__ = ()
     html_name = "output"
 
 
 class legend(Element[PrimitiveChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "legend"
 
 
 class option(Element[PrimitiveChildren, OptionAttrs]):
+    __slots__ = ()
     html_name = "option"
 
 
 class optgroup(Element[AnyChildren, OptgroupAttrs]):
+    __slots__ = ()
     html_name = "optgroup"
 
 
 class select(Element[AnyChildren, SelectAttrs]):
+    __slots__ = ()
     html_name = "select"
 
 
 class textarea(Element[PrimitiveChildren, TextAreaAttrs]):
+    __slots__ = ()
     html_name = "textarea"
 
 
 class fieldset(Element[AnyChildren, FieldsetAttrs]):
+    __slots__ = ()
     html_name = "fieldset"
 
 
 class form(Element[AnyChildren, FormAttrs]):
+    __slots__ = ()
     html_name = "form"
 
 
 class img(Element[NoChildren, ImgAttrs]):
+    __slots__ = ()
     html_name = "img"
 
 
 class svg(Element[AnyChildren, SvgAttrs]):
+    __slots__ = ()
     html_name = "svg"
 
 
 class circle(Element[AnyChildren, CircleAttrs]):
+    __slots__ = ()
     html_name = "circle"
 
 
 class line(Element[AnyChildren, LineAttrs]):
+    __slots__ = ()
     html_name = "line"
 
 
 class path(Element[AnyChildren, PathAttrs]):
+    __slots__ = ()
     html_name = "path"
 
 
 class polyline(Element[AnyChildren, PolylineAttrs]):
+    __slots__ = ()
     html_name = "polyline"
 
 
 class b(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "b"
 
 
 class i(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "i"
 
 
 class s(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "s"
 
 
 class u(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "u"
 
 
 class strong(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "strong"
 
 
 class em(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "em"
 
 
 class mark(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "mark"
 
 
 class del_(Element[AnyChildren, DelAttrs]):
+    __slots__ = ()
     html_name = "del"
 
 
 class ins(Element[AnyChildren, InsAttrs]):
+    __slots__ = ()
     html_name = "ins"
 
 
 class header(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "header"
 
 
 class big(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "big"
 
 
 class small(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "small"
 
 
 class code(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "code"
 
 
 class pre(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "pre"
 
 
 class cite(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "cite"
 
 
 class blockquote(Element[AnyChildren, BlockquoteAttrs]):
+    __slots__ = ()
     html_name = "blockquote"
 
 
 class abbr(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "abbr"
 
 
 class h1(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "h1"
 
 
 class h2(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "h2"
 
 
 class h3(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "h3"
 
 
 class h4(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "h4"
 
 
 class h5(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "h5"
 
 
 class h6(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "h6"
 
 
 class title(Element[PrimitiveChildren, NoAttrs]):
+    __slots__ = ()
     html_name = "title"
 
 
 class link(Element[PrimitiveChildren, HeadLinkAttrs]):
+    __slots__ = ()
     html_name = "link"
 
 
 class style(BaseElement, GlobalStyles):
+    __slots__ = ("_themed_styles",)
     html_name = "style"
 
     children: tuple[GlobalStyles | Callable[[Theme], GlobalStyles] | str]
     attrs: StyleAttrs
 
+    # styles created by a callable for a theme name along with the theme used
+    # and the version of the themes, as themes can be changed in place
+    _themed_styles: dict[str, tuple[Theme, int, GlobalStyles]]
+
     def __init__(
         self,
         styles: GlobalStyles | Callable[[Theme], GlobalStyles] | str,
@@ -335,6 +402,7 @@ class style(BaseElement, GlobalStyles):
         **attrs: Unpack[StyleAttrs],
     ) -> None:
         super().__init__(styles, **attrs)
+        self._themed_styles = {}
 
         if theme:
             self.context["theme"] = theme
@@ -367,33 +435,34 @@ class style(BaseElement, GlobalStyles):
         if isinstance(self.children[0], str):
             return {}
         elif callable(self.children[0]):
-            return self.children[0](self.theme)
+            theme = self.theme
+            cached = self._themed_styles.get(theme.name)
+            if cached is None or cached[0] is not theme or cached[1] != theme._version:
+                cached = self._themed_styles[theme.name] = (
+                    theme,
+                    theme._version,
+                    self.children[0](theme),
+                )
+            return cached[2]
         else:
             return self.children[0]
 
     @styles.setter
     def styles(self, value: GlobalStyles) -> None:
         self.children = (value,)
+        self._themed_styles.clear()
 
-    def to_html(self) -> str:
-        dom: BaseElement = self
-        while dom != (rendered_dom := dom.render()):
-            dom = rendered_dom
-
-        attributes = ""
-        if formatted_attrs := dom._format_attributes():
-            attributes = f" {formatted_attrs}"
+    def _render_into(self, buf: list[str]) -> None:
+        buf.append(self._open_tag)
+        if formatted_attrs := self._format_attributes():
+            buf.append(f" {formatted_attrs}")
 
-        if isinstance(dom.children[0], str):
+        if isinstance(self.children[0], str):
             css_styles = self.children[0]
         else:
             css_styles = format_styles(self.styles)
 
-        return (
-            f"<{dom.html_name}{attributes}>\n"
-            f"{css_styles}\n"
-            f"</{dom.html_name}>"
-        )  # fmt: off
+        buf.append(f">\n{css_styles}\n{self._close_tag}")
 
     @override
     def render(self) -> BaseElement:
@@ -401,223 +470,278 @@ class style(BaseElement, GlobalStyles):
 
 
 class script(Element[PrimitiveChildren, ScriptAttrs]):
+    __slots__ = ()
     html_name = "script"
     always_pair = True
 
 
 class noscript(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "noscript"
     always_pair = True
 
 
 class meta(Element[PrimitiveChildren, MetaAttrs]):
+    __slots__ = ()
     html_name = "meta"
 
 
 class head(Element[AnyChildren, NoAttrs]):
+    __slots__ = ()
     html_name = "head"
 
 
 class body(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "body"
 
 
 class footer(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "footer"
 
 
 class html(ElementStrict[head, body, HtmlTagAttrs]):
+    __slots__ = ()
     html_header = "<!doctype html>"
     html_name = "html"
 
 
 class iframe(Element[NoChildren, IframeAttrs]):
+    __slots__ = ()
     html_name = "iframe"
 
 
 class article(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "article"
 
 
 class address(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "address"
 
 
 class caption(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "caption"
 
 
 class col(Element[NoChildren, ColAttrs]):
+    __slots__ = ()
     html_name = "col"
 
 
 class colgroup(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "colgroup"
 
 
 class area(Element[NoChildren, AreaAttrs]):
+    __slots__ = ()
     html_name = "area"
 
 
 class aside(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "aside"
 
 
 class source(Element[NoChildren, SourceAttrs]):
+    __slots__ = ()
     html_name = "source"
 
 
 class audio(Element[AnyChildren, AudioAttrs]):
+    __slots__ = ()
     html_name = "audio"
 
 
 class base(Element[NoChildren, BaseAttrs]):
+    __slots__ = ()
     html_name = "base"
 
 
 class bdi(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "bdi"
 
 
 class bdo(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "bdo"
 
 
 class canvas(Element[AnyChildren, CanvasAttrs]):
+    __slots__ = ()
     html_name = "canvas"
 
 
 class data(Element[AnyChildren, DataAttrs]):
+    __slots__ = ()
     html_name = "data"
 
 
 class datalist(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "datalist"
 
 
 class details(Element[AnyChildren, DetailsAttrs]):
+    __slots__ = ()
     html_name = "details"
 
 
 class dfn(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "dfn"
 
 
 class dialog(Element[AnyChildren, DialogAttrs]):
+    __slots__ = ()
     html_name = "dialog"
 
 
 class embed(Element[NoChildren, EmbedAttrs]):
+    __slots__ = ()
     html_name = "embed"
 
 
 class figcaption(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "figcaption"
 
 
 class figure(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "figure"
 
 
 class hrgroup(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "hrgroup"
 
 
 class hr(Element[NoChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "hr"
 
 
 class kbd(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "kbd"
 
 
 class map(Element[AnyChildren, MapAttrs]):
+    __slots__ = ()
     html_name = "map"
 
 
 class menu(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "menu"
 
 
 class meter(Element[AnyChildren, MeterAttrs]):
+    __slots__ = ()
     html_name = "meter"
 
 
 class nav(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "nav"
 
 
 class object(Element[AnyChildren, ObjectAttrs]):
+    __slots__ = ()
     html_name = "object"
 
 
 class param(Element[NoChildren, ParamAttrs]):
+    __slots__ = ()
     html_name = "param"
 
 
 class picture(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "picture"
 
 
 class progress(Element[AnyChildren, ProgressAttrs]):
+    __slots__ = ()
     html_name = "progress"
 
 
 class q(Element[AnyChildren, QAttrs]):
+    __slots__ = ()
     html_name = "q"
 
 
 class rp(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "rp"
 
 
 class rt(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "rt"
 
 
 class ruby(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "ruby"
 
 
 class samp(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "samp"
 
 
 class search(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "search"
 
 
 class sub(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "sub"
 
 
 class summary(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "summary"
 
 
 class sup(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "sup"
 
 
 class template(Element[AnyChildren, HtmlAttrs]):
+    __slots__ = ()
     html_name = "template"
 
 
 class time(Element[AnyChildren, TimeAttrs]):
+    __slots__ = ()
     html_name = "time"
 
 
 class track(Element[NoChildren, TrackAttrs]):
+    __slots__ = ()
     html_name = "track"
 
 
 class var(Element[AnyChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "var"
 
 
 class video(Element[AnyChildren, VideoAttrs]):
+    __slots__ = ()
     html_name = "video"
 
 
 class wbr(Element[NoChildren, GlobalAttrs]):
+    __slots__ = ()
     html_name = "wbr"
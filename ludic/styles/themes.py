@@ -1,6 +1,6 @@
 from abc import ABCMeta, abstractmethod
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, TypeVar
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, ClassVar, Self, TypeVar
 
 from .types import Color, Size
 
@@ -10,8 +10,20 @@ if TYPE_CHECKING:
 _T = TypeVar("_T", bound="BaseElement")
 
 
+class _Versioned:
+    """Base class for theme settings counting the changes made to them."""
+
+    # incremented whenever a theme or any of its settings is changed, so that
+    # values computed from themes can be invalidated
+    _version: ClassVar[int] = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        _Versioned._version += 1
+
+
 @dataclass
-class Colors:
+class Colors(_Versioned):
     """Colors for a theme."""
 
     primary: Color = Color("#4ecdc4")
@@ -27,9 +39,41 @@ class Colors:
     white: Color = Color("#fff")
     black: Color = Color("#222")
 
+    def darken(self, factor: float = 0.5) -> Self:
+        """Darken all the colors by a given factor.
+
+        Args:
+            factor (float, optional): Darkening factor. Defaults to 0.5.
+
+        Returns:
+            Colors: New colors with all the colors darkened.
+        """
+        return type(self)(
+            **{
+                item.name: getattr(self, item.name).darken(factor)
+                for item in fields(self)
+            }
+        )
+
+    def lighten(self, factor: float = 0.5) -> Self:
+        """Lighten all the colors by a given factor.
+
+        Args:
+            factor (float, optional): Lightening factor. Defaults to 0.5.
+
+        Returns:
+            Colors: New colors with all the colors lightened.
+        """
+        return type(self)(
+            **{
+                item.name: getattr(self, item.name).lighten(factor)
+                for item in fields(self)
+            }
+        )
+
 
 @dataclass
-class Header:
+class Header(_Versioned):
     """Header for a theme."""
 
     size: Size = Size(1.5, "em")
@@ -37,7 +81,7 @@ class Header:
 
 
 @dataclass
-class Headers:
+class Headers(_Versioned):
     """Headers for a theme."""
 
     h1: Header = field(default_factory=lambda: Header(size=Size(3, "em"), anchor=False))
@@ -55,7 +99,7 @@ class Headers:
 
 
 @dataclass
-class Fonts:
+class Fonts(_Versioned):
     """Font sizes for a theme."""
 
     plain: str = "Helvetica Neue, Helvetica, Arial, sans-serif"
@@ -66,7 +110,7 @@ class Fonts:
 
 
 @dataclass
-class Sizes:
+class Sizes(_Versioned):
     """Size for a theme."""
 
     xxxxs: Size = Size(0.39)
@@ -83,7 +127,7 @@ class Sizes:
 
 
 @dataclass
-class Borders:
+class Borders(_Versioned):
     """Border sizes for a theme."""
 
     thin: Size = Size(0.1)
@@ -92,7 +136,7 @@ class Borders:
 
 
 @dataclass
-class Rounding:
+class Rounding(_Versioned):
     """Border rounding for a theme."""
 
     less: Size = Size(0.20)
@@ -101,7 +145,7 @@ class Rounding:
 
 
 @dataclass
-class Sidebar:
+class Sidebar(_Versioned):
     """Sidebar layout config for a theme."""
 
     # The width of the sidebar (empty means not set; defaults to the content width)
@@ -112,7 +156,7 @@ class Sidebar:
 
 
 @dataclass
-class Switcher:
+class Switcher(_Versioned):
     """Switcher layout config for a theme."""
 
     # The container width at which the component switches between a horizontal and
@@ -124,7 +168,7 @@ class Switcher:
 
 
 @dataclass
-class Layouts:
+class Layouts(_Versioned):
     """Layout configuration for a theme."""
 
     sidebar: Sidebar = field(default_factory=Sidebar)
@@ -132,7 +176,7 @@ class Layouts:
 
 
 @dataclass
-class Theme(metaclass=ABCMeta):
+class Theme(_Versioned, metaclass=ABCMeta):
     """An abstract base class for theme configuration."""
 
     measure: Size = Size(110, "ch")
@@ -1,4 +1,5 @@
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Literal, LiteralString, Self, SupportsIndex, TypedDict
 
 from .utils import (
@@ -11,13 +12,32 @@ from .utils import (
 SizeUnit = Literal["px", "ex", "em", "ch", "rem", "vw", "vh", "vmin", "vmax", "%"]
 
 
+@lru_cache(maxsize=1024)
+def _hex_to_rgb(color: str) -> tuple[int, int, int]:
+    return hex_to_rgb(color)
+
+
+@lru_cache(maxsize=1024)
+def _darken(color: str, factor: float) -> str:
+    return darken_color(color, factor)
+
+
+@lru_cache(maxsize=1024)
+def _lighten(color: str, factor: float) -> str:
+    return lighten_color(color, factor)
+
+
 class Color(str):
-    """Color class."""
+    """Color class.
+
+    Colors are immutable, so the results of the conversions
+    are cached and computed only once for each color and factor.
+    """
 
     @property
     def rgb(self) -> tuple[int, int, int]:
         """RGB color."""
-        return hex_to_rgb(self)
+        return _hex_to_rgb(self)
 
     def darken(self, factor: float = 0.5) -> Self:
         """Darken color by a given factor.
@@ -28,7 +48,7 @@ class Color(str):
         Returns:
             str: Darkened color.
         """
-        return type(self)(darken_color(self, factor))
+        return type(self)(_darken(self, factor))
 
     def lighten(self, factor: float = 0.5) -> Self:
         """Lighten color by a given factor.
@@ -39,7 +59,7 @@ class Color(str):
         Returns:
             str: Lightened color.
         """
-        return type(self)(lighten_color(self, factor))
+        return type(self)(_lighten(self, factor))
 
     def readable(self) -> Self:
         """Get lighter or darker variant of the given color depending on the luminance.
@@ -1,3 +1,6 @@
+from collections.abc import Mapping
+from functools import cache
+from types import MappingProxyType
 from typing import (
     Annotated,
     Any,
@@ -35,7 +38,7 @@ def get_element_generic_args(cls_or_obj: Any) -> tuple[type, ...] | None:
 
 def get_element_attrs_annotations(
     cls_or_obj: Any, include_extras: bool = False
-) -> dict[str, Any]:
+) -> Mapping[str, Any]:
     """Get the annotations of the element.
 
     Args:
@@ -43,22 +46,35 @@ def get_element_attrs_annotations(
         include_extras (bool): Whether to include extra annotation info.
 
     Returns:
-        dict[str, Any]: The attributes' annotations of the element.
+        Mapping[str, Any]: The attributes' annotations of the element.
     """
+    if isinstance(cls_or_obj, type):
+        return _get_class_attrs_annotations(cls_or_obj, include_extras)
+    return _get_attrs_annotations(cls_or_obj, include_extras)
+
+
+def _get_attrs_annotations(cls_or_obj: Any, include_extras: bool) -> dict[str, Any]:
     if (args := get_element_generic_args(cls_or_obj)) is not None:
         return get_type_hints(args[-1], include_extras=include_extras)
     return {}
 
 
+@cache
+def _get_class_attrs_annotations(cls: type, include_extras: bool) -> Mapping[str, Any]:
+    # the annotations are a function of the class, so they are resolved only once
+    # and shared as a read-only mapping
+    return MappingProxyType(_get_attrs_annotations(cls, include_extras))
+
+
 def get_annotations_metadata_of_type(
-    annotations: dict[str, Any],
+    annotations: Mapping[str, Any],
     expected_type: type[_T],
     default: _T | None = None,
 ) -> dict[str, _T]:
     """Get the metadata of the annotations with the given type.
 
     Args:
-        annotations (dict[str, Any]): The annotations.
+        annotations (Mapping[str, Any]): The annotations.
         expected_type (Any): The expected type.
         default (Any, optional): The default type.
 
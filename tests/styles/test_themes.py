@@ -5,10 +5,11 @@ from ludic.html import a, b, div, style
 from ludic.styles.themes import (
     Colors,
     Fonts,
+    Theme,
     get_default_theme,
     set_default_theme,
 )
-from ludic.styles.types import Color, Size
+from ludic.styles.types import Color, GlobalStyles, Size
 from ludic.types import Component
 
 from . import BarTheme, FooTheme
@@ -41,6 +42,12 @@ def test_theme_colors() -> None:
 
     assert theme.colors.primary.darken(0.5).rgb == (97, 115, 126)
 
+    darker = theme.colors.darken(0.5)
+    assert darker.primary.rgb == (97, 115, 126)
+    assert darker.white.rgb == (127, 127, 127)
+    assert darker.light.rgb == (119, 119, 119)
+    assert theme.colors.lighten(0.5).dark.rgb == (153, 153, 153)
+
 
 def test_theme_font_sizes() -> None:
     theme = FooTheme(fonts=Fonts(size=Size(10, "px")))
@@ -117,3 +124,37 @@ def test_element_theme_switching() -> None:
           f"#c2 a {{ color: {foo.colors.danger}; }}\n"
         "</style>"
     )  # fmt: skip
+
+
+def test_themed_styles_cached() -> None:
+    calls: list[str] = []
+
+    def make_styles(theme: Theme) -> GlobalStyles:
+        calls.append(theme.name)
+        return {"a": {"color": theme.colors.primary}, "b": {"color": "red"}}
+
+    styles = style.use(make_styles)
+    foo, bar = FooTheme(), BarTheme()
+
+    for _ in range(2):
+        assert dict(foo.use(styles).items()) == {
+            "a": {"color": foo.colors.primary},
+            "b": {"color": "red"},
+        }
+    assert calls == ["foo"]
+
+    bar.use(styles)
+    assert styles["a"] == {"color": bar.colors.primary}
+    foo.use(styles)
+    assert styles["a"] == {"color": foo.colors.primary}
+    assert calls == ["foo", "bar"]
+
+    other_foo = FooTheme(colors=Colors(primary=Color("#000")))
+    other_foo.use(styles)
+    assert styles["a"] == {"color": "#000"}
+    assert calls == ["foo", "bar", "foo"]
+
+    other_foo.colors.primary = Color("#111")
+    assert styles["a"] == {"color": "#111"}
+    assert styles["a"] == {"color": "#111"}
+    assert calls == ["foo", "bar", "foo", "foo"]
@@ -1,9 +1,29 @@
-from ludic.catalog.forms import Form, InputField, TextAreaField
+import time
+from collections.abc import Hashable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Any
+
+import pytest
+
+from ludic import base
+from ludic.attrs import Attrs
+from ludic.catalog.forms import (
+    FieldMeta,
+    Form,
+    InputField,
+    TextAreaField,
+    create_fields,
+)
+from ludic.catalog.headers import H1, H2, Anchor
 from ludic.catalog.items import Key, Pairs, Value
 from ludic.catalog.navigation import Navigation, NavItem
 from ludic.catalog.tables import Table, TableHead, TableRow
 from ludic.catalog.typography import Link, Paragraph
-from ludic.html import b
+from ludic.html import b, dt
+from ludic.styles.themes import Header, Headers
+from ludic.types import Safe
+
+from .styles import FooTheme
 
 
 def test_link() -> None:
@@ -133,3 +153,141 @@ def test_form_fields() -> None:
             "</div>"
         "</form>"
     )  # fmt: skip
+
+
+def test_create_fields() -> None:
+    class PersonAttrs(Attrs):
+        id: str
+        name: Annotated[str, FieldMeta(label="Name")]
+        email: Annotated[str, FieldMeta(label=None, type="email")]
+
+    person = PersonAttrs(id="1", name="John", email="john@example.com")
+    for _ in range(2):
+        assert Form(*create_fields(person, spec=PersonAttrs)).to_html() == (
+            '<form class="form stack">'
+                '<div class="form-field">'
+                    '<label for="name">Name</label>'
+                    '<input value="John" type="text" name="name" id="name" />'
+                "</div>"
+                '<div class="form-field">'
+                    '<input value="john@example.com" type="email" '
+                    'name="email" id="email" />'
+                "</div>"
+            "</form>"
+        )  # fmt: skip
+
+
+def test_create_fields_kinds() -> None:
+    class NoteAttrs(Attrs):
+        text: Annotated[str, FieldMeta(label=None, kind="textarea")]
+        done: Annotated[bool, FieldMeta(label=None, kind="checkbox")]
+
+    note = NoteAttrs(text="Hello", done=True)
+    assert Form(*create_fields(note, spec=NoteAttrs)).to_html() == (
+        '<form class="form stack">'
+            '<div class="form-field">'
+                '<textarea name="text" id="text">Hello</textarea>'
+            "</div>"
+            '<div class="form-field">'
+                '<input checked="checked" type="checkbox" name="done" id="done" />'
+            "</div>"
+        "</form>"
+    )  # fmt: skip
+
+
+def test_pure_headers() -> None:
+    expected = (
+        '<div class="with-anchor">'
+            '<h2 id="hello">Hello</h2>'
+            '<a href="#hello" class="anchor">#</a>'
+        "</div>"
+    )  # fmt: skip
+
+    for _ in range(2):
+        assert H2("Hello").to_html() == expected  # type: ignore[call-arg]
+        assert H1("Hello").to_html() == "<h1>Hello</h1>"  # type: ignore[call-arg]
+        assert H1("<b>").to_html() == "<h1>&lt;b&gt;</h1>"  # type: ignore[call-arg]
+        assert H1(Safe("<b>")).to_html() == "<h1><b></h1>"  # type: ignore[call-arg]
+
+    assert H2("Hello", anchor=Anchor("*", target="foo")).to_html() == (  # type: ignore[call-arg]
+        '<div class="with-anchor">'
+            '<h2 id="hello">Hello</h2>'
+            '<a href="#foo" class="anchor">*</a>'
+        "</div>"
+    )  # fmt: skip
+    assert H1("Hello", anchor=Anchor(target="foo")).to_html() == (  # type: ignore[call-arg]
+        '<div class="with-anchor">'
+            '<h1 id="hello">Hello</h1>'
+            '<a href="#foo" class="anchor">#</a>'
+        "</div>"
+    )  # fmt: skip
+
+    # themes with the same name but different settings do not share the cache
+    plain_theme = FooTheme()
+    anchor_theme = FooTheme(headers=Headers(h1=Header(anchor=True)))
+    assert plain_theme == anchor_theme
+
+    header = H1("Hi")  # type: ignore[call-arg]
+    assert plain_theme.use(header).to_html() == "<h1>Hi</h1>"
+    header = H1("Hi")  # type: ignore[call-arg]
+    assert anchor_theme.use(header).to_html() == (
+        '<div class="with-anchor">'
+            '<h1 id="hi">Hi</h1>'
+            '<a href="#hi" class="anchor">#</a>'
+        "</div>"
+    )  # fmt: skip
+
+    # changing a theme in place does not serve the previously cached HTML
+    plain_theme.headers.h1.anchor = True
+    header = H1("Hi")  # type: ignore[call-arg]
+    assert plain_theme.use(header).to_html() == (
+        '<div class="with-anchor">'
+            '<h1 id="hi">Hi</h1>'
+            '<a href="#hi" class="anchor">#</a>'
+        "</div>"
+    )  # fmt: skip
+
+    # the pure flag is not inherited by subclasses
+    class CustomH1(H1):
+        pass
+
+    class PureH1(H1):
+        pure = True
+
+    assert H1.pure
+    assert not CustomH1.pure
+    assert PureH1.pure
+
+
+def test_pure_headers_in_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    class SlowCache(dict[Hashable, Any]):
+        def __iter__(self) -> Iterator[Hashable]:
+            # give other threads the chance to evict the same element
+            keys = list(super().__iter__())
+            time.sleep(0.001)
+            return iter(keys)
+
+    monkeypatch.setattr(base, "PURE_ELEMENTS_CACHE", SlowCache())
+    monkeypatch.setattr(base, "PURE_ELEMENTS_CACHE_SIZE", 8)
+
+    def render(thread: int) -> None:
+        for idx in range(20):
+            text = f"Header {thread} {idx}"
+            header = H1(text)  # type: ignore[call-arg]
+            assert header.to_html() == f"<h1>{text}</h1>"
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for result in [executor.submit(render, thread) for thread in range(8)]:
+            result.result()
+
+    assert len(base.PURE_ELEMENTS_CACHE) == 8
+
+
+def test_render_as() -> None:
+    key = Key("Name", id="name")
+    rendered = key.render()
+
+    assert isinstance(rendered, dt)
+    assert rendered == dt("Name", id="name")
+    assert rendered.attrs is not key.attrs
+    assert key.to_html() == '<dt id="name">Name</dt>'
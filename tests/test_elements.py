@@ -16,6 +16,7 @@ from ludic.html import (
     tr,
 )
 from ludic.styles import CSSProperties
+from ludic.types import BaseElement
 
 
 def test_empty_element() -> None:
@@ -162,3 +163,36 @@ def test_repr_and_str() -> None:
         "  <p>3</p>\n"
         "</div>"
     )  # fmt: skip
+
+
+def test_deeply_nested() -> None:
+    dom: BaseElement = b("deep")
+    for _ in range(100):
+        dom = div(dom)
+
+    assert dom.to_html() == "<div>" * 100 + "<b>deep</b>" + "</div>" * 100
+    assert dom.to_string(pretty=False) == (
+        "<div>" * 100 + "<b>deep</b>" + "</div>" * 100
+    )
+
+    for _ in range(5000):
+        dom = div(dom)
+
+    assert dom.to_html() == "<div>" * 5100 + "<b>deep</b>" + "</div>" * 5100
+
+
+def test_nested_custom_to_html() -> None:
+    class custom(p):
+        def to_html(self) -> str:
+            return "<custom />"
+
+    assert custom("x").to_html() == "<custom />"
+    assert div(custom("x")).to_html() == "<div><custom /></div>"
+    assert div(span(custom("x")), "y").to_html() == (
+        "<div><span><custom /></span>y</div>"
+    )
+
+
+def test_elements_without_dict() -> None:
+    assert not hasattr(div(), "__dict__")
+    assert not hasattr(b("text", id="x"), "__dict__")
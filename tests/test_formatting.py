@@ -1,7 +1,15 @@
+import pytest
+
 from ludic.catalog.typography import Link, Paragraph
-from ludic.format import FormatContext, format_attr_value
+from ludic.format import (
+    FormatContext,
+    extract_identifiers,
+    format_attr_value,
+    format_element,
+    get_attrs_aliases,
+)
 from ludic.html import b, div, i, p, strong
-from ludic.types import BaseElement
+from ludic.types import BaseElement, JavaScript, Safe
 
 
 def test_format_attr_value() -> None:
@@ -91,3 +99,36 @@ def test_escaping_works() -> None:
 def test_quotes_not_escaped() -> None:
     dom = p("It's alive <3.")
     assert dom.to_html() == "<p>It's alive &lt;3.</p>"
+
+
+def test_format_element() -> None:
+    assert format_element("plain text") == "plain text"
+    assert format_element("<b>&</b>") == "&lt;b&gt;&amp;&lt;/b&gt;"
+    assert format_element("'quoted' \"text\"") == "'quoted' \"text\""
+    assert format_element(Safe("<b>&</b>")) == "<b>&</b>"
+    assert format_element(JavaScript("a < b")) == "a < b"
+    assert format_element(b("<bold>")) == "<b>&lt;bold&gt;</b>"
+    assert format_element(42) == "42"
+
+
+def test_extract_identifiers() -> None:
+    assert extract_identifiers("plain text") == []
+    assert extract_identifiers("{not an id}") == []
+    assert extract_identifiers("a {12:id} b") == ["a ", 12, " b"]
+    assert extract_identifiers("{1:id}{2:id} 3:id") == [1, 2, " 3:id"]
+
+
+def test_attributes_escaping() -> None:
+    assert div(id="<&>").to_html() == '<div id="&lt;&amp;&gt;" />'
+    assert div(classes=["a<b", "c"]).to_html() == '<div class="a&lt;b c" />'
+    assert (
+        div(style={"color": "<red>"}).to_html() == '<div style="color:&lt;red&gt;" />'
+    )
+
+
+def test_attrs_aliases_read_only() -> None:
+    aliases = get_attrs_aliases(div)
+    assert aliases["class_"] == "class"
+    with pytest.raises(TypeError):
+        aliases["class_"] = "foo"  # type: ignore[index]
+    assert get_attrs_aliases(div)["class_"] == "class"
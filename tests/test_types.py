@@ -1,5 +1,8 @@
+import pytest
+
 from ludic.html import div, script
 from ludic.types import JavaScript, Safe
+from ludic.utils import get_element_attrs_annotations
 
 
 def test_safe() -> None:
@@ -21,3 +24,11 @@ def test_javascript() -> None:
         script(JavaScript("document.write('<h2>HTML</h2>');")).to_html()
         == "<script>document.write('<h2>HTML</h2>');</script>"
     )
+
+
+def test_attrs_annotations_read_only() -> None:
+    annotations = get_element_attrs_annotations(div)
+    assert "id" in annotations
+    with pytest.raises(TypeError):
+        annotations["id"] = int  # type: ignore[index]
+    assert get_element_attrs_annotations(div)["id"] is str